@@ -1,6 +1,15 @@
 #!/usr/bin/env python3
-"""Count tokens in raw arcade response files using tiktoken."""
+"""Count tokens in raw toolkit response files (raw/{toolkit}/) using tiktoken.
 
+Run with no arguments to count every toolkit, or name toolkits to count
+only those (e.g. `python scripts/count_tokens.py arcade`). Other scripts
+can import iter_rows() to reuse the same walk and batched tokenization.
+"""
+
+import argparse
+import concurrent.futures
+import functools
+import itertools
 import json
 import os
 import sys
@@ -11,9 +20,16 @@ except ImportError:
     print("tiktoken not installed. Run: pip3 install tiktoken")
     sys.exit(1)
 
-enc = tiktoken.get_encoding("cl100k_base")
+# orjson is optional; it only speeds up record counting
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
+ENCODING = "cl100k_base"
 
-ARCADE_DIR = os.path.join(os.path.dirname(__file__), "..", "raw", "arcade")
+RAW_DIR = os.path.join(os.path.dirname(__file__), "..", "raw")
 
 files = [
     ("01", "01-list-all-companies.json"),
@@ -26,36 +42,153 @@ files = [
     ("08", "08-sort-and-limit.json"),
 ]
 
-print(f"\n{'#':<4} {'File':<40} {'Tokens':>8} {'Records':>8}")
-print("-" * 64)
+# Per-file report lines, formatted straight from iter_rows() row dicts
+ROW_FMT = "{qid:<4} {file:<40} {tokens:>8,} {bytes:>10,} {records!s:>8}".format_map
+MISSING_FMT = "{qid:<4} {file:<40}  MISSING".format_map
+
+
+@functools.lru_cache(maxsize=None)
+def get_encoding(name=ENCODING):
+    """Load a tiktoken encoding once; the BPE merge table is parsed on first use only."""
+    return tiktoken.get_encoding(name)
 
-total_tokens = 0
-rows = []
 
-for qid, filename in files:
-    filepath = os.path.join(ARCADE_DIR, filename)
-    if not os.path.exists(filepath):
-        print(f"{qid:<4} {filename:<40} {'MISSING':>8}")
-        continue
+def count_tokens(text, encoding=ENCODING):
+    """Return the number of tokens in text.
 
-    with open(filepath, "r") as f:
-        raw = f.read()
+    Uses encode_ordinary: inputs are machine-generated JSON, so the
+    special-token scan done by encode() is wasted work.
+    """
+    return len(get_encoding(encoding).encode_ordinary(text))
 
-    tokens = len(enc.encode(raw))
-    total_tokens += tokens
 
+def count_records(data):
+    """Return the number of records in a saved tool response, or "ERR"."""
+    if data.get("error") or data.get("successful") is False:
+        return "ERR"
+    # Arcade nests results under response.records, Composio under data.data
+    response = data.get("response") or data.get("data") or {}
+    return len(response.get("records") or response.get("data") or [])
+
+
+def records_in(raw):
+    """Parse a response file's text and count its records ("?" if unparseable)."""
     try:
-        data = json.loads(raw)
-        response = data.get("response") or {}
-        records = len(response.get("records", [])) if response else 0
-        if data.get("error"):
-            records = "ERR"
+        return count_records(json_loads(raw))
     except Exception:
-        records = "?"
+        return "?"
+
+
+def iter_rows(raw_dir=RAW_DIR, toolkits=None):
+    """Yield one row dict per expected query file under raw_dir/{toolkit}/.
+
+    Rows carry toolkit, qid, file, tokens, bytes and records; for a missing
+    file the last three are None. Toolkits without any response files are
+    skipped, and `toolkits` (a name or an iterable of names) restricts the
+    walk to the named directories.
+    """
+    if toolkits:
+        toolkits = {toolkits} if isinstance(toolkits, str) else set(toolkits)
+    # Read every response file first so the whole set is tokenized in one
+    # batch call (parallel inside tiktoken) instead of one call per file.
+    items = []
+    texts = []
+    found = set()  # toolkits with at least one response file
+    with os.scandir(raw_dir) as it:
+        toolkit_entries = sorted(
+            (e for e in it if e.is_dir() and (not toolkits or e.name in toolkits)),
+            key=lambda e: e.name,
+        )
+    for toolkit_entry in toolkit_entries:
+        toolkit = toolkit_entry.name
+        # One directory read per toolkit instead of a stat per expected file
+        with os.scandir(toolkit_entry.path) as it:
+            present = {e.name: e for e in it if e.is_file()}
+        for qid, filename in files:
+            entry = present.get(filename)
+            if entry is None:
+                items.append((toolkit, qid, filename, None, None))
+                continue
+            # On-disk size is the UTF-8 byte count
+            size = entry.stat().st_size
+            # Text mode on purpose: some saved responses have CRLF line endings
+            # and the published counts are over the newline-normalized text.
+            with open(entry.path, "r", encoding="utf-8") as f:
+                raw = f.read()
+            items.append((toolkit, qid, filename, size, raw))
+            texts.append(raw)
+            found.add(toolkit)
+
+    # Byte-identical responses (re-saved runs, identical empty results) are
+    # tokenized once; str hashes are cached, so the dict is the content key.
+    unique = list(dict.fromkeys(texts))
+    # tiktoken hands each text to its thread pool as one task, in order;
+    # largest first keeps one huge response from starting last and running
+    # alone while the other threads sit idle.
+    unique.sort(key=len, reverse=True)
+    enc = get_encoding()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        # tiktoken releases the GIL while encoding, so the record counting
+        # below runs on this thread concurrently with the batch encode. Only
+        # the lengths come back; the token lists die inside the worker.
+        lengths = pool.submit(
+            lambda: list(map(len, enc.encode_ordinary_batch(unique, num_threads=os.cpu_count() or 1)))
+        )
+        records_by_text = {text: records_in(text) for text in unique}
+        tokens_by_text = dict(zip(unique, lengths.result()))
+
+    for toolkit, qid, filename, size, raw in items:
+        if toolkit not in found:
+            continue
+        row = {"toolkit": toolkit, "qid": qid, "file": filename, "tokens": None, "bytes": size, "records": None}
+        if raw is not None:
+            row["tokens"] = tokens_by_text[raw]
+            row["records"] = records_by_text[raw]
+        yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Count tokens in raw toolkit responses.")
+    parser.add_argument("toolkits", nargs="*", help="toolkit directories under raw/ to count (default: all)")
+    args = parser.parse_args()
+    if args.toolkits:
+        with os.scandir(RAW_DIR) as it:
+            available = {e.name for e in it if e.is_dir()}
+        missing = [name for name in args.toolkits if name not in available]
+        if missing:
+            parser.error(f"unknown toolkit(s): {', '.join(missing)}")
+
+    lines = []  # the report is written to stdout in one call at the end
+    toolkits = []
+    for toolkit, group in itertools.groupby(iter_rows(toolkits=args.toolkits), key=lambda r: r["toolkit"]):
+        toolkits.append(toolkit)
+
+        lines.append(f"\n{toolkit}")
+        lines.append(f"{'#':<4} {'File':<40} {'Tokens':>8} {'Bytes':>10} {'Records':>8}")
+        lines.append("-" * 75)
+
+        total_tokens = 0
+        total_bytes = 0
+        for r in group:
+            if r["tokens"] is None:
+                lines.append(MISSING_FMT(r))
+                continue
+
+            total_tokens += r["tokens"]
+            total_bytes += r["bytes"]
+            lines.append(ROW_FMT(r))
+
+        lines.append("-" * 75)
+        lines.append(f"{'TOTAL':<44} {total_tokens:>8,} {total_bytes:>10,}")
+
+    # iter_rows() skips toolkits without response files; say so for named ones
+    for toolkit in dict.fromkeys(args.toolkits):
+        if toolkit not in toolkits:
+            lines.append(f"\n{toolkit}: no responses")
+
+    lines.append("")
+    sys.stdout.write("\n".join(lines) + "\n")
 
-    rows.append((qid, filename, tokens, records))
-    print(f"{qid:<4} {filename:<40} {tokens:>8,} {str(records):>8}")
 
-print("-" * 64)
-print(f"{'TOTAL':<44} {total_tokens:>8,}")
-print()
+if __name__ == "__main__":
+    main()
@@ -42,8 +42,8 @@ SCENARIO COVERAGE
 USAGE
 =====
     export ATTIO_API_KEY="your-sandbox-workspace-key"
-    pip install httpx tiktoken
-    python seed_workspace.py
+    pip install "httpx[http2]" tiktoken
+    python seed_workspace.py            # add --quiet to skip the intro and next-steps text
 
 REPRODUCIBILITY
 ===============
@@ -51,34 +51,92 @@ This script is idempotent for companies (upserts on domain) and people
 (upserts on email). Deals are created fresh each run. For a clean start,
 delete and recreate the workspace.
 
+Setting $ATTIO_SEED_CACHE to a file path remembers company and person
+upserts in a local SQLite cache, keyed by workspace and payload, so
+re-running against the same workspace skips the ones whose data hasn't
+changed. Skipped records aren't re-asserted, so leave it unset (the
+default) when a re-run must restore records changed or deleted by hand.
+
 All company data is publicly available (SEC filings, Wikipedia, company
 websites). Executive names are current as of early 2026.
 """
 
 import os
 import sys
+import argparse
 import json
 import time
+import random
+import sqlite3
+import hashlib
+import asyncio
+import email.utils
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
 import httpx
 
+try:
+    import h2  # noqa: F401 — installed by httpx[http2]; lets httpx speak HTTP/2
+    HTTP2 = True
+except ImportError:
+    HTTP2 = False
+
+# orjson is optional; it only speeds up request and response (de)serialization
+try:
+    import orjson
+    json_dumps, json_loads = orjson.dumps, orjson.loads
+except ImportError:
+    orjson = None
+    json_dumps, json_loads = json.dumps, json.loads
+
+# uvloop is optional (POSIX only); a faster drop-in event loop
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 
-API_KEY = os.environ.get("ATTIO_API_KEY")
-if not API_KEY:
-    print("Error: Set ATTIO_API_KEY environment variable")
-    print("  export ATTIO_API_KEY='your-sandbox-key'")
-    sys.exit(1)
-
 BASE_URL = "https://api.attio.com/v2"
 HEADERS = {
-    "Authorization": f"Bearer {API_KEY}",
     "Content-Type": "application/json",
-}
-RATE_LIMIT_DELAY = 0.15  # seconds between API calls
-
-client = httpx.Client(base_url=BASE_URL, headers=HEADERS, timeout=30)
+}  # plus Authorization, added by _make_client()
+# Attio allows 100 read and 25 write requests per second; stay just under.
+# Each rate is a token bucket refilled continuously, with a small burst.
+READ_RATE, READ_BURST = 90, 10
+WRITE_RATE, WRITE_BURST = 20, 5
+MAX_CONCURRENCY = 16     # API calls in flight at once
+MAX_RETRIES = 5          # retries after a 429 or transient error before giving up on a call
+RETRY_STATUSES = (500, 502, 503, 504)  # transient server errors, retried with backoff
+# Upsert cache across runs; opt-in, off unless set
+CACHE_PATH = os.environ.get("ATTIO_SEED_CACHE", "")
+
+# Created by main(); importing the module has no side effects
+client = None
+
+
+def _make_client(api_key):
+    """Build the shared Attio client.
+
+    HTTP/2 multiplexes the concurrent calls over one TLS connection and
+    HPACK-compresses the repeated Authorization header. Over HTTP/1.1 the
+    pool holds one kept-alive connection per in-flight call, and idle ones
+    outlive a Retry-After pause (httpx drops them after 5s by default).
+    """
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers={**HEADERS, "Authorization": f"Bearer {api_key}"},
+        timeout=30,
+        http2=HTTP2,
+        limits=httpx.Limits(
+            max_connections=MAX_CONCURRENCY,
+            max_keepalive_connections=MAX_CONCURRENCY,
+            keepalive_expiry=60,
+        ),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -154,13 +212,16 @@ DEAL_CUSTOM_ATTRIBUTES = [
      "description": "Expected or actual deal close date"},
 ]
 
+_N_COMPANY_ATTRS = len(COMPANY_CUSTOM_ATTRIBUTES)
+_N_DEAL_ATTRS = len(DEAL_CUSTOM_ATTRIBUTES)
+
 
 # ---------------------------------------------------------------------------
 # Company Data — 50 companies (F100 + well-known with "Tech" in name)
 # All data is publicly available.
 # ---------------------------------------------------------------------------
 
-COMPANIES = [
+COMPANIES = (
     # ===== TECHNOLOGY (15) =====
     {"name": "Apple Inc.", "domain": "apple.com", "industry": "Technology", "employee_count": 166000, "annual_revenue_b": 416, "founded_year": 1976, "headquarters": "Cupertino, CA", "description": "Consumer electronics, software, and services company known for iPhone, Mac, iPad, and Apple Watch.", "ceo": {"first": "Tim", "last": "Cook", "title": "Chief Executive Officer"}, "exec2": {"first": "Kevan", "last": "Parekh", "title": "Chief Financial Officer"}},
     {"name": "Microsoft Corporation", "domain": "microsoft.com", "industry": "Technology", "employee_count": 228000, "annual_revenue_b": 282, "founded_year": 1975, "headquarters": "Redmond, WA", "description": "Global technology company providing cloud computing, productivity software, and enterprise solutions.", "ceo": {"first": "Satya", "last": "Nadella", "title": "Chairman and Chief Executive Officer"}, "exec2": {"first": "Amy", "last": "Hood", "title": "Chief Financial Officer"}},
@@ -224,16 +285,30 @@ COMPANIES = [
     {"name": "3M Company", "domain": "3m.com", "industry": "Industrial", "employee_count": 85000, "annual_revenue_b": 25, "founded_year": 1902, "headquarters": "Saint Paul, MN", "description": "Diversified industrial manufacturer producing adhesives, abrasives, and electronic materials.", "ceo": {"first": "William", "last": "Brown", "title": "Chairman and Chief Executive Officer"}, "exec2": {"first": "Anurag", "last": "Maheshwari", "title": "Chief Financial Officer"}},
     {"name": "FedEx Corporation", "domain": "fedex.com", "industry": "Industrial", "employee_count": 430000, "annual_revenue_b": 88, "founded_year": 1971, "headquarters": "Memphis, TN", "description": "Multinational transportation and logistics company providing express delivery and freight services.", "ceo": {"first": "Rajesh", "last": "Subramaniam", "title": "President and Chief Executive Officer"}, "exec2": {"first": "John", "last": "Dietrich", "title": "Chief Financial Officer"}},
     {"name": "The Boeing Company", "domain": "boeing.com", "industry": "Industrial", "employee_count": 156000, "annual_revenue_b": 89, "founded_year": 1916, "headquarters": "Arlington, VA", "description": "Aerospace manufacturer producing commercial jetliners, military aircraft, and space systems.", "ceo": {"first": "Kelly", "last": "Ortberg", "title": "President and Chief Executive Officer"}, "exec2": {"first": "Jay", "last": "Malave", "title": "Chief Financial Officer"}},
-]
-
-assert len(COMPANIES) == 50, f"Expected 50 companies, got {len(COMPANIES)}"
+)
+
+# The ~100 contacts: each company's ceo and exec2 as one flat row, with the
+# email (the upsert key) derived once here
+PEOPLE = tuple(
+    {
+        "first": exec_data["first"],
+        "last": exec_data["last"],
+        "title": exec_data["title"],
+        "email": f"{exec_data['first'].lower().replace(' ', '')}.{exec_data['last'].lower().replace(' ', '')}@{c['domain']}",
+        "company": c["name"],
+        "company_idx": i,
+    }
+    for i, c in enumerate(COMPANIES)
+    for exec_data in (c["ceo"], c.get("exec2"))
+    if exec_data
+)
 
 
 # ---------------------------------------------------------------------------
 # Deal Data — 50 deals
 # ---------------------------------------------------------------------------
 
-DEALS = [
+DEALS = (
     # Nurture (22) — scenario 02
     {"name": "Apple - Enterprise License Agreement", "stage": "Nurture", "value": 75000, "close_date": "2026-02-15", "company_idx": 0, "champion": "Tim Cook", "use_case": "Enterprise platform deployment", "next_step": "Discovery call scheduled", "probability": 25, "contract_months": 24},
     {"name": "Microsoft - Cloud Migration Suite", "stage": "Nurture", "value": 120000, "close_date": "2026-04-01", "company_idx": 1, "champion": "CTO Office", "use_case": "Azure integration", "next_step": "Technical review", "probability": 20, "contract_months": 36},
@@ -295,52 +370,344 @@ DEALS = [
     {"name": "Microchip Technology - Dev Tools", "stage": "Closed Lost", "value": 27000, "close_date": "2025-09-20", "company_idx": 21, "champion": "VP Engineering", "use_case": "Embedded dev toolchain", "next_step": "N/A", "probability": 0, "contract_months": 12, "loss_reason": "Price"},
     {"name": "Roper Technologies - SaaS Module", "stage": "Closed Lost", "value": 35000, "close_date": "2025-08-30", "company_idx": 16, "champion": "Product Director", "use_case": "Vertical SaaS integration", "next_step": "N/A", "probability": 0, "contract_months": 12, "loss_reason": "Timing"},
     {"name": "Agilent Technologies - Lab System", "stage": "Closed Lost", "value": 61000, "close_date": "2025-11-10", "company_idx": 17, "champion": "Lab Ops Manager", "use_case": "Lab automation system", "next_step": "N/A", "probability": 0, "contract_months": 24, "loss_reason": "Feature Gap"},
-]
-
-assert len(DEALS) == 50, f"Expected 50 deals, got {len(DEALS)}"
+)
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def api_call(method, path, json_data=None, label=""):
-    """Make an API call with rate limiting and error handling."""
-    time.sleep(RATE_LIMIT_DELAY)
-    try:
-        if method == "GET":
-            resp = client.get(path)
-        elif method == "POST":
-            resp = client.post(path, json=json_data)
-        elif method == "PUT":
-            resp = client.put(path, json=json_data)
-        elif method == "PATCH":
-            resp = client.patch(path, json=json_data)
-        else:
-            raise ValueError(f"Unknown method: {method}")
-
-        if resp.status_code in (200, 201):
-            return resp.json()
-        elif resp.status_code == 409:
-            # Conflict — attribute or record already exists
-            return {"conflict": True, "status": 409, "detail": resp.text}
-        else:
-            print(f"  ERROR [{resp.status_code}] {label}: {resp.text[:200]}")
+_BANNER = "=" * 60  # rule above and below the phase and summary headings
+
+
+class TokenBucket:
+    """Admit calls at `rate` per second, allowing bursts of up to `burst`.
+
+    A 429 from the server pauses the whole bucket, not just the caller that
+    hit it, so the other in-flight calls back off too.
+    """
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+
+_read_bucket = TokenBucket(READ_RATE, READ_BURST)
+_write_bucket = TokenBucket(WRITE_RATE, WRITE_BURST)
+_in_flight = asyncio.Semaphore(MAX_CONCURRENCY)
+_retries = Counter()  # retried attempts by cause, reported in the summary
+
+
+def _retry_delay(resp, attempt):
+    """Seconds to wait before a retry: the server's Retry-After, else jittered backoff.
+
+    `resp` is None when the request failed without a response.
+    """
+    retry_after = resp.headers.get("retry-after") if resp is not None else None
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass
+        try:
+            # Attio sends an HTTP date rather than a number of seconds
+            retry_at = email.utils.parsedate_to_datetime(retry_after)
+            return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            pass
+    return 2 ** attempt * 0.1 + random.random() * 0.1
+
+
+async def api_call(method, path, json_data=None, label="", idempotent=True, parse_response=True, missing_ok=False):
+    """Make an API call with rate limiting and error handling.
+
+    Reads and writes draw from separate token buckets matching Attio's
+    limits; up to MAX_CONCURRENCY calls are in flight at once.
+
+    429s are always retried. 5xx responses and network errors are retried
+    only for idempotent calls (true of every call here except deal
+    creation, where a retry could duplicate a deal the server did create);
+    non-idempotent calls still retry failures to connect, since the
+    request never reached the server.
+
+    With parse_response=False a success returns True without decoding the
+    body, for callers that only need to know the call went through.
+    With missing_ok=True a 404 returns None without logging an error.
+    """
+    bucket = _read_bucket if method == "GET" else _write_bucket
+    # Serialize once, outside the retry loop; HEADERS already sets Content-Type.
+    # Bodies serialized ahead of time are passed through as-is.
+    if json_data is None or isinstance(json_data, (bytes, str)):
+        content = json_data
+    else:
+        content = json_dumps(json_data)
+    async with _in_flight:
+        for attempt in range(MAX_RETRIES + 1):
+            await bucket.acquire()
+            try:
+                resp = await client.request(method, path, content=content)
+
+                if resp.status_code == 429 and attempt < MAX_RETRIES:
+                    _retries["rate limited"] += 1
+                    bucket.pause(_retry_delay(resp, attempt))
+                    continue
+                if resp.status_code in RETRY_STATUSES and idempotent and attempt < MAX_RETRIES:
+                    # Not a rate signal, so only this call backs off
+                    _retries[f"HTTP {resp.status_code}"] += 1
+                    await asyncio.sleep(_retry_delay(resp, attempt))
+                    continue
+                if resp.status_code in (200, 201):
+                    return json_loads(resp.content) if parse_response else True
+                elif resp.status_code == 404 and missing_ok:
+                    return None
+                elif resp.status_code == 409:
+                    # Conflict — attribute or record already exists
+                    return {"conflict": True, "status": 409, "detail": resp.text}
+                else:
+                    print(f"  ERROR [{resp.status_code}] {label}: {resp.text[:200]}")
+                    return None
+            except httpx.TransportError as e:
+                connect_failed = isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout))
+                if (idempotent or connect_failed) and attempt < MAX_RETRIES:
+                    _retries[type(e).__name__] += 1
+                    await asyncio.sleep(_retry_delay(None, attempt))
+                    continue
+                print(f"  EXCEPTION {label}: {e}")
+                return None
+            except Exception as e:
+                print(f"  EXCEPTION {label}: {e}")
+                return None
+
+
+class UpsertCache:
+    """Record ids of earlier upserts, keyed by workspace, object and natural key.
+
+    A hit also needs the same payload digest, so editing a company's seed
+    data (or a person's company id changing) sends the upsert again.
+
+    Opening the database raises sqlite3.Error; after that, a database
+    error prints one warning and the run carries on uncached.
+    """
+
+    def __init__(self, path, workspace_id):
+        self.db = sqlite3.connect(path)
+        try:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                "workspace TEXT, object TEXT, key TEXT, digest TEXT, record_id TEXT, "
+                "PRIMARY KEY (workspace, object, key))"
+            )
+        except sqlite3.Error:
+            self.db.close()
+            raise
+        self.workspace_id = workspace_id
+        self.hits = 0
+        self.checked = None  # task checking the first cached company still exists
+
+    def _fail(self, err):
+        print(f"  WARNING: upsert cache disabled ({err}); continuing uncached")
+        self.db.close()
+        self.db = None
+
+    def get(self, object_slug, key, digest):
+        if self.db is None:
             return None
-    except Exception as e:
-        print(f"  EXCEPTION {label}: {e}")
-        return None
+        try:
+            row = self.db.execute(
+                "SELECT record_id FROM records WHERE workspace = ? AND object = ? AND key = ? AND digest = ?",
+                (self.workspace_id, object_slug, key, digest),
+            ).fetchone()
+        except sqlite3.Error as e:
+            self._fail(e)
+            return None
+        return row[0] if row else None
+
+    def put(self, object_slug, key, digest, record_id):
+        if self.db is None:
+            return
+        try:
+            self.db.execute(
+                "INSERT OR REPLACE INTO records VALUES (?, ?, ?, ?, ?)",
+                (self.workspace_id, object_slug, key, digest, record_id),
+            )
+        except sqlite3.Error as e:
+            self._fail(e)
+
+    def clear(self):
+        """Forget every record cached for this workspace."""
+        if self.db is None:
+            return
+        try:
+            self.db.execute("DELETE FROM records WHERE workspace = ?", (self.workspace_id,))
+        except sqlite3.Error as e:
+            self._fail(e)
+
+    def close(self):
+        if self.db is None:
+            return
+        try:
+            self.db.commit()
+        except sqlite3.Error as e:
+            print(f"  WARNING: could not save upsert cache ({e})")
+        self.db.close()
+
+
+_upsert_cache = None  # an UpsertCache once main() knows the workspace
+
+
+async def _cached_company_exists(record_id):
+    """Check that a cached company id still names a record in Attio.
+
+    Records deleted by hand would otherwise leave people and deals linked
+    to a company that no longer exists, so on failure the workspace's
+    cached rows are dropped and every upsert is sent again.
+    """
+    found = await api_call(
+        "GET", f"/objects/companies/records/{record_id}", label="check cached company",
+        parse_response=False, missing_ok=True,
+    )
+    if not found:
+        print("  Cached company no longer found in Attio; clearing this workspace's upsert cache")
+        _upsert_cache.clear()
+    return bool(found)
+
+
+async def upsert_record(object_slug, matching_attribute, key, payload, label):
+    """Assert (upsert) one record, skipping the call if the cache has it unchanged.
+
+    Returns the API result, or a result of the same shape for a cache hit.
+    """
+    digest = hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+    if _upsert_cache:
+        record_id = _upsert_cache.get(object_slug, key, digest)
+        if record_id and object_slug == "companies":
+            # One lookup per run, shared by every concurrent company hit
+            if _upsert_cache.checked is None:
+                _upsert_cache.checked = asyncio.ensure_future(_cached_company_exists(record_id))
+            if not await _upsert_cache.checked:
+                record_id = None
+        if record_id:
+            _upsert_cache.hits += 1
+            return {"data": {"id": {"record_id": record_id}}, "cached": True}
+    result = await api_call(
+        "PUT",
+        f"/objects/{object_slug}/records?matching_attribute={matching_attribute}",
+        payload,
+        label,
+    )
+    if _upsert_cache and result and "data" in result:
+        _upsert_cache.put(object_slug, key, digest, result["data"]["id"]["record_id"])
+    return result
+
+
+def _write_json(path, obj):
+    """Write obj to path (a Path) as 2-space-indented JSON, encoded in one call.
+
+    The file is written beside path and renamed over it, so a crash or a
+    concurrent reader never sees a half-written mapping. (Path.write_bytes
+    alone can't fsync before the rename, hence the explicit open.)
+    """
+    if orjson:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(obj, indent=2) + "\n").encode()  # ASCII-escaped, as json.dump wrote it
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    tmp_path.replace(path)
+
+
+def _build_mapping(companies, deals):
+    """Return the seed-record-mapping.json document for the created records."""
+    return {
+        "companies": companies,
+        "deals": deals,
+        "metadata": {
+            "total_companies": len(companies),
+            "total_deals": len(deals),
+            "total_company_custom_attrs": _N_COMPANY_ATTRS,
+            "total_deal_custom_attrs": _N_DEAL_ATTRS,
+            "script_version": "2.0",
+            "data_source": "Fortune 100 + public company data",
+        },
+    }
+
+
+def scenario_results():
+    """Return the seed rows each of the 8 benchmark scenarios should match.
+
+    Keys are the raw/{toolkit}/ file stems. Computed from the seed data
+    alone, so it checks coverage, not toolkit answers. Each list is swept
+    once, with every scenario filter applied per row.
+    """
+    nurture, high_value, pre_march = [], [], []
+    highest = DEALS[0]
+    for d in DEALS:
+        value = d["value"]
+        if d["stage"] == "Nurture":
+            nurture.append(d)
+        if value > 50000:
+            high_value.append(d)
+        if d["close_date"] < "2026-03-01":
+            pre_march.append(d)
+        if value > highest["value"]:
+            highest = d
+
+    tech_name, tech_industry, large_tech = [], [], []
+    for c in COMPANIES:
+        if "Tech" in c["name"]:
+            tech_name.append(c)
+        if c["industry"] == "Technology":
+            tech_industry.append(c)
+            if c["employee_count"] > 100:
+                large_tech.append(c)
+
+    return {
+        "01-list-all-companies": COMPANIES,
+        "02-deals-by-stage": nurture,
+        "03-deals-over-50k": high_value,
+        "04-companies-name-search": tech_name,
+        "05-technology-companies": tech_industry,
+        "06-deals-by-close-date": pre_march,
+        "07-compound-filter": large_tech,
+        "08-sort-and-limit": [highest],
+    }
 
 
 def validate_scenarios():
     """Check that seed data covers all 8 benchmark scenarios."""
-    nurture = [d for d in DEALS if d["stage"] == "Nurture"]
-    high_value = [d for d in DEALS if d["value"] > 50000]
-    tech_name = [c for c in COMPANIES if "Tech" in c["name"]]
-    tech_industry = [c for c in COMPANIES if c["industry"] == "Technology"]
-    large_tech = [c for c in COMPANIES if c["industry"] == "Technology" and c["employee_count"] > 100]
-    pre_march = [d for d in DEALS if d["close_date"] < "2026-03-01"]
-    highest = max(DEALS, key=lambda d: d["value"])
+    results = scenario_results()
+    nurture = results["02-deals-by-stage"]
+    high_value = results["03-deals-over-50k"]
+    tech_name = results["04-companies-name-search"]
+    tech_industry = results["05-technology-companies"]
+    large_tech = results["07-compound-filter"]
+    pre_march = results["06-deals-by-close-date"]
+    highest = results["08-sort-and-limit"][0]
 
     checks = [
         (len(COMPANIES) >= 25, f"01 List companies: {len(COMPANIES)} companies"),
@@ -384,41 +751,83 @@ def _attr_payload(attr):
     }
 
 
-def create_custom_attributes():
-    """Create custom attributes on companies and deals objects."""
-    print("=" * 60)
-    print("Phase 1: Creating custom attributes")
-    print("=" * 60)
+# The attribute definitions are static, so their request bodies are
+# serialized once at import rather than on every POST
+_ATTR_PAYLOADS = {
+    (object_slug, attr["api_slug"]): json_dumps(_attr_payload(attr))
+    for object_slug, attrs in (("companies", COMPANY_CUSTOM_ATTRIBUTES), ("deals", DEAL_CUSTOM_ATTRIBUTES))
+    for attr in attrs
+}
+
+
+async def create_custom_attributes(object_slug, attrs):
+    """Create custom attributes (and their select options) on one object.
 
+    Returns the set of (object_slug, api_slug) pairs that exist afterwards.
+    Lines are prefixed with the object, since the companies and deals
+    attributes are created concurrently and their output interleaves;
+    within one object, attributes and options are created in list order.
+    """
+    label = object_slug.capitalize()
     created = set()
 
-    for object_slug, attrs in [("companies", COMPANY_CUSTOM_ATTRIBUTES), ("deals", DEAL_CUSTOM_ATTRIBUTES)]:
-        label = object_slug.capitalize()
-        print(f"\n{label} ({len(attrs)} attributes):")
-        for attr in attrs:
-            result = api_call("POST", f"/objects/{object_slug}/attributes", _attr_payload(attr), attr["title"])
-            if result and not result.get("conflict"):
-                print(f"  + {attr['title']} ({attr['type']})")
+    async def existing_titles(path, key, label):
+        """GET a list endpoint and return the set of `key` values it holds.
+
+        A failed listing returns an empty set, so everything is POSTed and
+        duplicates come back as 409s, as before.
+        """
+        result = await api_call("GET", path, label=label)
+        return {item.get(key) for item in (result or {}).get("data", [])}
+
+    async def create(attr, existing):
+        name = f"{label}: {attr['title']}"
+        if attr["api_slug"] in existing:
+            print(f"  ~ {name} (already exists)")
+            created.add((object_slug, attr["api_slug"]))
+        else:
+            result = await api_call(
+                "POST",
+                f"/objects/{object_slug}/attributes",
+                _ATTR_PAYLOADS[(object_slug, attr["api_slug"])],
+                name,
+                parse_response=False,
+            )
+            if result is True:
+                print(f"  + {name} ({attr['type']})")
                 created.add((object_slug, attr["api_slug"]))
-            elif result and result.get("conflict"):
-                print(f"  ~ {attr['title']} (already exists)")
+            elif result:  # the 409 conflict dict
+                print(f"  ~ {name} (already exists)")
                 created.add((object_slug, attr["api_slug"]))
             else:
-                print(f"  ! {attr['title']} (failed)")
-                continue
-
-            # Create select options via the options endpoint
-            for opt in attr.get("options", []):
-                opt_result = api_call(
-                    "POST",
-                    f"/objects/{object_slug}/attributes/{attr['api_slug']}/options",
-                    {"data": {"title": opt}},
-                    f"option:{opt}",
-                )
-                if opt_result and not opt_result.get("conflict"):
-                    pass  # silently succeed
-                elif not opt_result:
-                    print(f"    ! option '{opt}' failed")
+                print(f"  ! {name} (failed)")
+                return
+
+        # Create select options via the options endpoint, skipping the ones
+        # an existing attribute already has
+        options = attr.get("options", [])
+        if options and attr["api_slug"] in existing:
+            have = await existing_titles(
+                f"/objects/{object_slug}/attributes/{attr['api_slug']}/options", "title", f"list {attr['api_slug']} options"
+            )
+            options = [opt for opt in options if opt not in have]
+        for opt in options:
+            opt_result = await api_call(
+                "POST",
+                f"/objects/{object_slug}/attributes/{attr['api_slug']}/options",
+                {"data": {"title": opt}},
+                f"option:{opt}",
+                parse_response=False,
+            )
+            if not opt_result:
+                print(f"    ! {name} option '{opt}' failed")
+
+    # One listing up front; on re-runs this replaces a POST (and 409) per attribute
+    existing = await existing_titles(f"/objects/{object_slug}/attributes", "api_slug", f"list {object_slug} attributes")
+    # One at a time, in list order: creation order is the order Attio lists
+    # attributes and options in, which the benchmark responses capture
+    for attr in attrs:
+        await create(attr, existing)
 
     return created
 
@@ -427,17 +836,44 @@ def create_custom_attributes():
 # Phase 2: Create companies
 # ---------------------------------------------------------------------------
 
-def create_companies(created_attrs):
+def _wrap_value(v):
+    return [{"value": v}]
+
+
+def _wrap_option(v):
+    return [{"option": v}]
+
+
+# Custom attributes copied straight from a seed row:
+# (row key, Attio attribute slug, value wrapper). Rows without the key, or
+# with None, leave the attribute unset.
+COMPANY_FIELDS = (
+    ("employee_count", "employee_count", _wrap_value),
+    ("annual_revenue_b", "annual_revenue", lambda b: b * 1_000_000_000),  # currency: plain number
+    ("founded_year", "founded_year", _wrap_value),
+    ("headquarters", "headquarters", _wrap_value),
+    ("industry", "industry", _wrap_option),
+)
+
+# Option values every seeded record gets; built once and shared by reference
+# across payloads, since nothing mutates them (tuples serialize as arrays)
+_LEAD_SOURCE_SEED = ({"option": "Benchmark Seed"},)
+_TIER_ENTERPRISE = ({"option": "Enterprise"},)
+_TIER_MID_MARKET = ({"option": "Mid-Market"},)
+_FUNDING_PUBLIC = ({"option": "Public"},)
+_CONTRACT_PROSPECT = ({"option": "Prospect"},)
+
+
+async def create_companies(created_attrs):
     """Create 50 companies using assert (upsert on domain)."""
-    print("\n" + "=" * 60)
+    print("\n" + _BANNER)
     print("Phase 2: Creating companies")
-    print("=" * 60)
+    print(_BANNER)
 
     def has(slug):
         return ("companies", slug) in created_attrs
 
-    company_records = []
-    for i, c in enumerate(COMPANIES):
+    async def upsert(i, c):
         values = {
             "name": [{"value": c["name"]}],
             "domains": [{"domain": c["domain"]}],
@@ -445,98 +881,86 @@ def create_companies(created_attrs):
         }
 
         # Custom attributes — only include if successfully created in Phase 1
-        if has("employee_count") and c.get("employee_count"):
-            values["employee_count"] = [{"value": c["employee_count"]}]
-        if has("annual_revenue") and c.get("annual_revenue_b"):
-            values["annual_revenue"] = c["annual_revenue_b"] * 1_000_000_000
-        if has("founded_year") and c.get("founded_year"):
-            values["founded_year"] = [{"value": c["founded_year"]}]
-        if has("headquarters") and c.get("headquarters"):
-            values["headquarters"] = [{"value": c["headquarters"]}]
-        if has("industry") and c.get("industry"):
-            values["industry"] = [{"option": c["industry"]}]
+        for key, slug, wrap in COMPANY_FIELDS:
+            v = c.get(key)
+            if v is not None and has(slug):
+                values[slug] = wrap(v)
         if has("lead_source"):
-            values["lead_source"] = [{"option": "Benchmark Seed"}]
+            values["lead_source"] = _LEAD_SOURCE_SEED
         if has("account_tier"):
-            values["account_tier"] = [{"option": "Enterprise" if c.get("employee_count", 0) > 50000 else "Mid-Market"}]
+            values["account_tier"] = _TIER_ENTERPRISE if c.get("employee_count", 0) > 50000 else _TIER_MID_MARKET
         if has("funding_stage"):
-            values["funding_stage"] = [{"option": "Public"}]
+            values["funding_stage"] = _FUNDING_PUBLIC
         if has("contract_status"):
-            values["contract_status"] = [{"option": "Prospect"}]
+            values["contract_status"] = _CONTRACT_PROSPECT
         if has("icp_score"):
             values["icp_score"] = [{"value": min(100, max(10, c.get("employee_count", 100) // 1000 + 40))}]
 
         payload = {"data": {"values": values}}
 
         # Use assert (upsert) on domains for idempotency
-        result = api_call(
-            "PUT",
-            "/objects/companies/records?matching_attribute=domains",
-            payload,
-            c["name"],
-        )
+        result = await upsert_record("companies", "domains", c["domain"], payload, c["name"])
 
         if result and "data" in result:
             record_id = result["data"]["id"]["record_id"]
-            company_records.append({"record_id": record_id, "name": c["name"], "idx": i})
-            print(f"  [{i+1:2d}/50] {c['name']} -> {record_id[:12]}...")
-        else:
-            company_records.append(None)
-            print(f"  [{i+1:2d}/50] FAILED: {c['name']}")
+            cached = " (cached)" if result.get("cached") else ""
+            print(f"  [{i+1:2d}/50] {c['name']} -> {record_id[:12]}...{cached}")
+            return {"record_id": record_id, "name": c["name"], "idx": i}
+        print(f"  [{i+1:2d}/50] FAILED: {c['name']}")
+        return None
 
-    return company_records
+    # gather() keeps COMPANIES order, so company_records[i] is COMPANIES[i]
+    return list(await asyncio.gather(*(upsert(i, c) for i, c in enumerate(COMPANIES))))
 
 
 # ---------------------------------------------------------------------------
 # Phase 3: Create people (C-Suite contacts)
 # ---------------------------------------------------------------------------
 
-def create_people(company_records):
+async def create_people(company_records):
     """Create ~100 people (2 per company) using assert (upsert on email)."""
-    print("\n" + "=" * 60)
+    print("\n" + _BANNER)
     print("Phase 3: Creating people (C-Suite contacts)")
-    print("=" * 60)
+    print(_BANNER)
 
     people_created = 0
-    for i, c in enumerate(COMPANIES):
-        if company_records[i] is None:
-            continue
-
-        company_id = company_records[i]["record_id"]
-        domain = c["domain"]
-
-        for exec_data in [c["ceo"], c.get("exec2")]:
-            if not exec_data:
-                continue
-
-            first = exec_data["first"]
-            last = exec_data["last"]
-            email = f"{first.lower().replace(' ', '')}.{last.lower().replace(' ', '')}@{domain}"
-
-            values = {
-                "name": [{"full_name": f"{first} {last}", "first_name": first, "last_name": last}],
-                "email_addresses": [{"email_address": email}],
-                "job_title": [{"value": exec_data["title"]}],
-                "company": [{"target_object": "companies", "target_record_id": company_id}],
-            }
-
-            payload = {"data": {"values": values}}
-            result = api_call(
-                "PUT",
-                "/objects/people/records?matching_attribute=email_addresses",
-                payload,
-                f"{first} {last}",
-            )
+    people_cached = 0  # skipped as unchanged since the last run
 
-            if result and "data" in result:
-                people_created += 1
-                if people_created <= 5 or people_created % 20 == 0:
-                    print(f"  [{people_created:3d}] {first} {last} ({exec_data['title']}) @ {c['name']}")
-            else:
-                if people_created == 0:
-                    print(f"  FAILED: {first} {last} — {result}")
+    async def upsert(p, company_id):
+        nonlocal people_created, people_cached
+
+        first = p["first"]
+        last = p["last"]
+
+        values = {
+            "name": [{"full_name": f"{first} {last}", "first_name": first, "last_name": last}],
+            "email_addresses": [{"email_address": p["email"]}],
+            "job_title": [{"value": p["title"]}],
+            "company": [{"target_object": "companies", "target_record_id": company_id}],
+        }
+
+        payload = {"data": {"values": values}}
+        result = await upsert_record("people", "email_addresses", p["email"], payload, f"{first} {last}")
+
+        if result and result.get("cached"):
+            people_cached += 1
+        elif result and "data" in result:
+            people_created += 1
+            if people_created <= 5 or people_created % 20 == 0:
+                print(f"  [{people_created:3d}] {first} {last} ({p['title']}) @ {p['company']}")
+        else:
+            if people_created == 0:
+                print(f"  FAILED: {first} {last} — {result}")
+
+    await asyncio.gather(*(
+        upsert(p, company_records[p["company_idx"]]["record_id"])
+        for p in PEOPLE
+        if company_records[p["company_idx"]] is not None
+    ))
 
     print(f"\n  Total people created: {people_created}")
+    if people_cached:
+        print(f"  Unchanged since last run (cached): {people_cached}")
     return people_created
 
 
@@ -544,17 +968,28 @@ def create_people(company_records):
 # Phase 4: Create deals
 # ---------------------------------------------------------------------------
 
-def create_deals(company_records, created_attrs, owner_id):
+# Same shape as COMPANY_FIELDS
+DEAL_FIELDS = (
+    ("close_date", "close_date", _wrap_value),
+    ("champion", "champion", _wrap_value),
+    ("use_case", "use_case", _wrap_value),
+    ("next_step", "next_step", _wrap_value),
+    ("probability", "probability", _wrap_value),  # 0 is a real value for lost deals
+    ("contract_months", "contract_length_months", _wrap_value),
+    ("loss_reason", "loss_reason", _wrap_option),
+)
+
+
+async def create_deals(company_records, created_attrs, owner_id):
     """Create 50 deals with associations to companies."""
-    print("\n" + "=" * 60)
+    print("\n" + _BANNER)
     print("Phase 4: Creating deals")
-    print("=" * 60)
+    print(_BANNER)
 
     def has(slug):
         return ("deals", slug) in created_attrs
 
-    deal_records = []
-    for i, d in enumerate(DEALS):
+    async def create(i, d):
         values = {
             "name": [{"value": d["name"]}],
             # Required fields: stage + owner
@@ -566,10 +1001,6 @@ def create_deals(company_records, created_attrs, owner_id):
         if d.get("value"):
             values["value"] = d["value"]
 
-        # Close date — custom date attribute
-        if has("close_date") and d.get("close_date"):
-            values["close_date"] = [{"value": d["close_date"]}]
-
         # Associated company
         company_idx = d.get("company_idx")
         if company_idx is not None and company_records[company_idx]:
@@ -578,123 +1009,159 @@ def create_deals(company_records, created_attrs, owner_id):
                 "target_record_id": company_records[company_idx]["record_id"],
             }]
 
-        # Custom deal attributes — only include if created in Phase 1
-        if has("champion") and d.get("champion"):
-            values["champion"] = [{"value": d["champion"]}]
-        if has("use_case") and d.get("use_case"):
-            values["use_case"] = [{"value": d["use_case"]}]
-        if has("next_step") and d.get("next_step"):
-            values["next_step"] = [{"value": d["next_step"]}]
-        if has("probability") and d.get("probability") is not None:
-            values["probability"] = [{"value": d["probability"]}]
-        if has("contract_length_months") and d.get("contract_months"):
-            values["contract_length_months"] = [{"value": d["contract_months"]}]
-        if has("loss_reason") and d.get("loss_reason"):
-            values["loss_reason"] = [{"option": d["loss_reason"]}]
+        # Custom deal attributes (close date included) — only if created in Phase 1
+        for key, slug, wrap in DEAL_FIELDS:
+            v = d.get(key)
+            if v is not None and has(slug):
+                values[slug] = wrap(v)
         if has("deal_lead_source"):
-            values["deal_lead_source"] = [{"option": "Benchmark Seed"}]
+            values["deal_lead_source"] = _LEAD_SOURCE_SEED
 
         payload = {"data": {"values": values}}
-        result = api_call("POST", "/objects/deals/records", payload, d["name"])
+        # Deals are created fresh, not upserted, so a blind retry could duplicate one
+        result = await api_call("POST", "/objects/deals/records", payload, d["name"], idempotent=False)
 
         if result and "data" in result:
             record_id = result["data"]["id"]["record_id"]
-            deal_records.append({"record_id": record_id, "name": d["name"], "stage": d["stage"]})
             print(f"  [{i+1:2d}/50] {d['name']} (${d['value']:,}) -> {record_id[:12]}...")
-        else:
-            deal_records.append(None)
-            print(f"  [{i+1:2d}/50] FAILED: {d['name']}")
+            return {"record_id": record_id, "name": d["name"], "stage": d["stage"]}
+        print(f"  [{i+1:2d}/50] FAILED: {d['name']}")
+        return None
 
-    return deal_records
+    return list(await asyncio.gather(*(create(i, d) for i, d in enumerate(DEALS))))
 
 
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
-def main():
-    print()
-    print("=" * 60)
-    print("  ATTIO MCP BENCHMARK — WORKSPACE SEEDER")
-    print("=" * 60)
-    print()
-    print("  50 companies (Fortune 100 + well-known)")
-    print("  ~100 contacts (real C-Suite executives)")
-    print("  50 deals (synthetic enterprise scenarios)")
-    print("  25 custom attributes (realistic B2B CRM fields)")
-    print()
-
-    # Validate
-    if not validate_scenarios():
-        print("ERROR: Seed data does not cover all scenarios. Fix the data.")
-        sys.exit(1)
+async def main():
+    global client, _upsert_cache
+    parser = argparse.ArgumentParser(description="Seed an Attio workspace for the MCP benchmark.")
+    parser.add_argument("--quiet", action="store_true", help="skip the intro blurb and next-steps guidance")
+    args = parser.parse_args()
 
-    # Test API connection
-    print("Testing API connection...")
-    test = api_call("GET", "/self", label="whoami")
-    if test is None:
-        print("ERROR: Cannot connect to Attio API. Check your API key.")
+    api_key = os.environ.get("ATTIO_API_KEY")
+    if not api_key:
+        print("Error: Set ATTIO_API_KEY environment variable")
+        print("  export ATTIO_API_KEY='your-sandbox-key'")
         sys.exit(1)
-    print(f"  Connected as workspace: {test.get('data', {}).get('workspace', {}).get('name', 'unknown')}")
-    print()
-
-    # Get workspace member ID for deal ownership
-    workspace_members = api_call("GET", "/workspace_members", label="list members")
-    owner_id = None
-    if workspace_members and "data" in workspace_members:
-        for member in workspace_members["data"]:
-            owner_id = member["id"]["workspace_member_id"]
-            print(f"  Deal owner: {member.get('first_name', '')} {member.get('last_name', '')} ({owner_id[:12]}...)")
-            break
-    if not owner_id:
-        print("ERROR: Could not find a workspace member for deal ownership.")
-        sys.exit(1)
-    print()
-
-    # Run phases
-    created_attrs = create_custom_attributes()
-    company_records = create_companies(created_attrs)
-    create_people(company_records)
-    deal_records = create_deals(company_records, created_attrs, owner_id)
+    client = _make_client(api_key)
+    # Close the client and save the cache however the run ends, sys.exit() included
+    try:
+        print()
+        print(_BANNER)
+        print("  ATTIO MCP BENCHMARK — WORKSPACE SEEDER")
+        print(_BANNER)
+        print()
+        if not args.quiet:
+            print("  50 companies (Fortune 100 + well-known)")
+            print("  ~100 contacts (real C-Suite executives)")
+            print("  50 deals (synthetic enterprise scenarios)")
+            print("  25 custom attributes (realistic B2B CRM fields)")
+            print()
+
+        # Validate (checked here rather than at import, so importing the data is free)
+        assert len(COMPANIES) == 50, f"Expected 50 companies, got {len(COMPANIES)}"
+        assert len(DEALS) == 50, f"Expected 50 deals, got {len(DEALS)}"
+        if not validate_scenarios():
+            print("ERROR: Seed data does not cover all scenarios. Fix the data.")
+            sys.exit(1)
+
+        # Test API connection
+        print("Testing API connection...")
+        test = await api_call("GET", "/self", label="whoami")
+        if test is None:
+            print("ERROR: Cannot connect to Attio API. Check your API key.")
+            sys.exit(1)
+        print(f"  Connected as workspace: {test.get('data', {}).get('workspace', {}).get('name', 'unknown')}")
+        print()
+
+        workspace_id = test.get("workspace_id")
+        if CACHE_PATH and workspace_id:
+            try:
+                _upsert_cache = UpsertCache(CACHE_PATH, workspace_id)
+            except sqlite3.Error as e:
+                print(f"  WARNING: cannot open upsert cache {CACHE_PATH} ({e}); running uncached")
+
+        # Get workspace member ID for deal ownership
+        workspace_members = await api_call("GET", "/workspace_members", label="list members")
+        owner_id = None
+        if workspace_members and "data" in workspace_members:
+            for member in workspace_members["data"]:
+                owner_id = member["id"]["workspace_member_id"]
+                print(f"  Deal owner: {member.get('first_name', '')} {member.get('last_name', '')} ({owner_id[:12]}...)")
+                break
+        if not owner_id:
+            print("ERROR: Could not find a workspace member for deal ownership.")
+            sys.exit(1)
+        print()
+
+        # Run phases as a dependency graph rather than strictly in sequence:
+        #   company attrs -> companies -> people
+        #                             \-> deals <- deal attrs
+        # Deal attributes don't wait for anything, and people and deals start as
+        # soon as the companies they link to exist.
+        print(_BANNER)
+        print("Phase 1: Creating custom attributes "
+              f"({_N_COMPANY_ATTRS} companies, {_N_DEAL_ATTRS} deals)")
+        print(_BANNER)
+
+        async def seed_companies():
+            company_attrs = await create_custom_attributes("companies", COMPANY_CUSTOM_ATTRIBUTES)
+            return await create_companies(company_attrs)
+
+        deal_attrs_task = asyncio.create_task(create_custom_attributes("deals", DEAL_CUSTOM_ATTRIBUTES))
+        company_records = await seed_companies()
+
+        async def seed_deals():
+            return await create_deals(company_records, await deal_attrs_task, owner_id)
+
+        _, deal_records = await asyncio.gather(create_people(company_records), seed_deals())
+    finally:
+        await client.aclose()
+        if _upsert_cache:
+            _upsert_cache.close()
 
     # Save mapping
-    output_dir = os.path.dirname(os.path.abspath(__file__))
-    mapping_path = os.path.join(output_dir, "..", "seed-record-mapping.json")
-    mapping = {
-        "companies": [r for r in company_records if r],
-        "deals": [r for r in deal_records if r],
-        "metadata": {
-            "total_companies": sum(1 for r in company_records if r),
-            "total_deals": sum(1 for r in deal_records if r),
-            "total_company_custom_attrs": len(COMPANY_CUSTOM_ATTRIBUTES),
-            "total_deal_custom_attrs": len(DEAL_CUSTOM_ATTRIBUTES),
-            "script_version": "2.0",
-            "data_source": "Fortune 100 + public company data",
-        },
-    }
-    with open(mapping_path, "w") as f:
-        json.dump(mapping, f, indent=2)
+    # Failed records are None; drop them once and count what's left
+    companies = list(filter(None, company_records))
+    deals = list(filter(None, deal_records))
+    created_companies = len(companies)
+    created_deals = len(deals)
+    mapping_path = Path(__file__).resolve().parent.parent / "seed-record-mapping.json"
+    _write_json(mapping_path, _build_mapping(companies, deals))
 
     # Summary
-    created_companies = sum(1 for r in company_records if r)
-    created_deals = sum(1 for r in deal_records if r)
-
-    print()
-    print("=" * 60)
-    print("  SEED COMPLETE")
-    print("=" * 60)
-    print(f"  Companies:  {created_companies}/50")
-    print(f"  Deals:      {created_deals}/50")
-    print(f"  Custom attrs (companies): {len(COMPANY_CUSTOM_ATTRIBUTES)}")
-    print(f"  Custom attrs (deals):     {len(DEAL_CUSTOM_ATTRIBUTES)}")
-    print(f"  Record mapping: {mapping_path}")
-    print()
-    print("  Next steps:")
-    print("    1. Connect Arcade, Composio, and Attio Official MCP servers")
-    print("    2. Run the 3 benchmark prompts from CONTEXT_DUMP.md")
-    print("    3. Run: python scripts/count_tokens.py")
-    print()
+    lines = [  # the summary is written to stdout in one call
+        "",
+        _BANNER,
+        "  SEED COMPLETE",
+        _BANNER,
+        f"  Companies:  {created_companies}/50",
+        f"  Deals:      {created_deals}/50",
+        f"  Custom attrs (companies): {_N_COMPANY_ATTRS}",
+        f"  Custom attrs (deals):     {_N_DEAL_ATTRS}",
+    ]
+    if _upsert_cache:
+        lines.append(f"  Upserts skipped (cached): {_upsert_cache.hits}")
+    if _retries:
+        lines.append(f"  Retries: {', '.join(f'{n} {cause}' for cause, n in _retries.most_common())}")
+    lines += [f"  Record mapping: {mapping_path}", ""]
+    if not args.quiet:
+        lines += [
+            "  Next steps:",
+            "    1. Connect Arcade, Composio, and Attio Official MCP servers",
+            "    2. Run the 3 benchmark prompts from CONTEXT_DUMP.md",
+            "    3. Run: python scripts/count_tokens.py",
+            "",
+        ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
-    main()
+    # uvloop.run() arrived in 0.18; older releases only offer install()
+    run = getattr(uvloop, "run", None)
+    if uvloop and run is None:
+        uvloop.install()
+    (run or asyncio.run)(main())